@@ -4,18 +4,137 @@ Automatically analyze open-ended user feedback using sentiment analysis
 Categorizes themes and generates insights from qualitative data at scale
 """
 
-from textblob import TextBlob
+from textblob.en.sentiments import PatternAnalyzer
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
+import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+try:
+    import spacy
+    from spacytextblob.spacytextblob import SpacyTextBlob  # noqa: F401 - registers the 'spacytextblob' pipe
+except ImportError:
+    spacy = None
+
+# Sentiment classes, in display order
+SENTIMENT_LABELS = ['positive', 'neutral', 'negative']
+
+# Feedback volume above which sentiment scoring is spread across processes
+PARALLEL_SCORING_THRESHOLD = 1000
+
+# TextBlob's default sentiment analyzer, created once and called directly
+# (skips building a TextBlob wrapper per response)
+_analyzer = PatternAnalyzer()
+
+def _polarity(text):
+    """Polarity of a single feedback string (module-level so worker processes can pickle it)"""
+    return _analyzer.analyze(text)[0]
+
+def _score_polarities(texts):
+    """Score a list of feedback strings, in parallel for large batches"""
+    scores = np.empty(len(texts), dtype=np.float64)
+    if len(texts) > PARALLEL_SCORING_THRESHOLD:
+        workers = os.cpu_count() or 1
+        chunksize = -(-len(texts) // workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for i, polarity in enumerate(executor.map(_polarity, texts, chunksize=chunksize)):
+                scores[i] = polarity
+    else:
+        for i, text in enumerate(texts):
+            scores[i] = _polarity(text)
+    return scores
+
 class FeedbackAnalyzer:
-    def __init__(self):
-        """Initialize feedback analyzer"""
+    # Common UX/product keywords to look for, grouped by theme
+    THEME_CATEGORIES = {
+        'usability': ['easy', 'difficult', 'confusing', 'intuitive', 'simple', 'complicated'],
+        'performance': ['fast', 'slow', 'quick', 'loading', 'responsive', 'laggy'],
+        'design': ['design', 'interface', 'layout', 'navigation', 'menu', 'button'],
+        'functionality': ['search', 'find', 'discover', 'browse', 'filter', 'sort'],
+        'personalization': ['recommendation', 'suggest', 'personalize', 'relevant', 'accurate'],
+        'technical_issues': ['bug', 'error', 'crash', 'broken', 'issue', 'problem'],
+        'sentiment': ['love', 'hate', 'like', 'dislike', 'amazing', 'terrible', 'great', 'awful']
+    }
+    
+    # Problem-related keywords used to surface priority issues
+    PROBLEM_KEYWORDS = [
+        'slow', 'confusing', 'difficult', 'complicated', 'broken', 'error', 
+        'bug', 'crash', 'loading', 'laggy', 'terrible', 'awful', 'hate',
+        'problem', 'issue', 'frustrating', 'annoying'
+    ]
+    
+    # Shared spaCy pipeline, loaded on first use (False if unavailable)
+    _nlp = None
+    
+    # matplotlib.pyplot, imported on first plot
+    _plt = None
+    
+    def __init__(self, use_spacy=False):
+        """
+        Initialize feedback analyzer
+        
+        Args:
+            use_spacy (bool): Score sentiment through spaCy's batched pipe with the
+                spacytextblob component instead of calling TextBlob's analyzer directly.
+                Scores are identical, but spacytextblob builds a TextBlob per response,
+                so this is opt-in for pipelines that already run spaCy
+        """
+        self.use_spacy = use_spacy
         self.feedback_data = None
         self.analysis_results = {}
+        self._pass_results = None
+        self._text_cache = None
+        
+        # Keyword -> theme category lookup, built once for O(1) membership tests
+        self._keyword_categories = {
+            keyword: category
+            for category, keywords in self.THEME_CATEGORIES.items()
+            for keyword in keywords
+        }
+        
+        # Fixed keyword order (grouped by category) for array-based counting
+        self._ux_keywords = list(self._keyword_categories)
+        self._keyword_index = {keyword: i for i, keyword in enumerate(self._ux_keywords)}
+        self._category_starts = np.cumsum([0] + [len(k) for k in self.THEME_CATEGORIES.values()])[:-1]
+        
+        # Single-pass keyword matchers: emit only whole-word keyword hits
+        self._ux_re = self._keyword_pattern(self._keyword_categories)
+        self._problem_re = self._keyword_pattern(self.PROBLEM_KEYWORDS)
+    
+    @staticmethod
+    def _keyword_pattern(keywords):
+        """Compile a whole-word alternation regex for a keyword list"""
+        return re.compile(r'\b(' + '|'.join(map(re.escape, keywords)) + r')\b')
+    
+    @classmethod
+    def _load_nlp(cls):
+        """Load the tokenizer-only spaCy sentiment pipeline once, or None if unavailable"""
+        if cls._nlp is None:
+            cls._nlp = False
+            if spacy is not None:
+                try:
+                    # Only the tokenizer is kept; every trained component is left out
+                    nlp = spacy.load('en_core_web_sm', exclude=[
+                        'tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner', 'senter'
+                    ])
+                    nlp.add_pipe('spacytextblob')
+                    cls._nlp = nlp
+                except OSError:
+                    print("⚠️ spaCy model 'en_core_web_sm' not found, falling back to TextBlob")
+        return cls._nlp or None
+    
+    @classmethod
+    def _pyplot(cls):
+        """Import pyplot (Agg backend) on first use so analysis-only runs never load matplotlib"""
+        if cls._plt is None:
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+            cls._plt = plt
+        return cls._plt
         
     def load_feedback(self, feedback_list):
         """
@@ -28,50 +147,100 @@ class FeedbackAnalyzer:
             self.feedback_data = feedback_list
         else:
             self.feedback_data = pd.DataFrame({'feedback': feedback_list})
+        self._pass_results = None
+        self._text_cache = None
         
         print(f"✅ Loaded {len(self.feedback_data)} feedback responses")
         return True
     
+    def _texts(self):
+        """Feedback column as a NumPy array of plain strings (missing -> ''), built once per load"""
+        if self._text_cache is None:
+            self._text_cache = self.feedback_data['feedback'].fillna('').astype(str).to_numpy()
+        return self._text_cache
+    
+    def _pipeline(self):
+        """
+        Score sentiment and match UX/problem keywords in a single pass over the feedback
+        
+        Each distinct response is lowercased, scored and matched once; results are
+        cached until new feedback is loaded.
+        
+        Returns:
+            Dictionary with per-row sentiment scores, per-keyword counts and problem counter
+        """
+        if self._pass_results is not None:
+            return self._pass_results
+        
+        # Work on each distinct response once (first-seen order keeps keyword ordering stable)
+        codes, unique_texts = pd.factorize(self._texts())
+        occurrences = np.bincount(codes, minlength=len(unique_texts)).tolist()
+        unique_texts = unique_texts.tolist()
+        
+        # Score sentiment, batching through spaCy when requested and available
+        nlp = self._load_nlp() if self.use_spacy else None
+        if nlp is not None:
+            unique_scores = np.fromiter(
+                (doc._.blob.polarity for doc in nlp.pipe(unique_texts, batch_size=1000)),
+                dtype=np.float64, count=len(unique_texts)
+            )
+        else:
+            unique_scores = _score_polarities(unique_texts)
+        
+        # Match UX keywords everywhere and problem keywords in negative responses; the
+        # mask uses the float64 scores and the same test analyze_sentiment labels with
+        is_negative = (unique_scores.astype(np.float64, copy=False) < -0.1).tolist()
+        keyword_hits = []
+        hit_weights = []
+        problem_counts = Counter()
+        for text, negative, count in zip(unique_texts, is_negative, occurrences):
+            text = text.lower()
+            hits = self._ux_re.findall(text)
+            keyword_hits.extend(self._keyword_index[keyword] for keyword in hits)
+            hit_weights.extend([count] * len(hits))
+            if negative:
+                for keyword in self._problem_re.findall(text):
+                    problem_counts[keyword] += count
+        
+        keyword_counts = np.zeros(len(self._ux_keywords), dtype=np.int64)
+        np.add.at(keyword_counts, np.array(keyword_hits, dtype=np.intp), np.array(hit_weights, dtype=np.int64))
+        
+        self._pass_results = {
+            'sentiment_scores': unique_scores[codes],
+            'keyword_counts': keyword_counts,
+            'problem_counts': problem_counts
+        }
+        return self._pass_results
+    
     def analyze_sentiment(self):
         """Perform sentiment analysis on all feedback"""
         if self.feedback_data is None:
             print("❌ No feedback data loaded")
             return None
             
-        sentiments = []
-        sentiment_scores = []
-        
-        for feedback in self.feedback_data['feedback']:
-            if pd.isna(feedback):
-                sentiments.append('neutral')
-                sentiment_scores.append(0)
-                continue
-                
-            blob = TextBlob(str(feedback))
-            polarity = blob.sentiment.polarity
-            
-            # Classify sentiment
-            if polarity > 0.1:
-                sentiment = 'positive'
-            elif polarity < -0.1:
-                sentiment = 'negative'  
-            else:
-                sentiment = 'neutral'
-                
-            sentiments.append(sentiment)
-            sentiment_scores.append(polarity)
+        sentiment_scores = self._pipeline()['sentiment_scores']
+        
+        # Classify sentiment on the full-precision scores (TextBlob averages such as
+        # 0.10000000000000007 round to exactly 0.1 in float32)
+        sentiments = np.where(
+            sentiment_scores > 0.1, 'positive',
+            np.where(sentiment_scores < -0.1, 'negative', 'neutral')
+        )
         
-        self.feedback_data['sentiment'] = sentiments
-        self.feedback_data['sentiment_score'] = sentiment_scores
+        # Three fixed labels: store as a categorical (int8 codes) rather than object strings
+        self.feedback_data['sentiment'] = pd.Categorical(sentiments, categories=SENTIMENT_LABELS)
+        self.feedback_data['sentiment_score'] = sentiment_scores.astype(np.float32)
         
-        # Calculate sentiment distribution
-        sentiment_dist = pd.Series(sentiments).value_counts()
-        sentiment_percentages = (sentiment_dist / len(sentiments) * 100).round(1)
+        # Calculate sentiment distribution (most common first)
+        labels, counts = np.unique(sentiments, return_counts=True)
+        order = np.argsort(-counts, kind='stable')
+        labels, counts = labels[order], counts[order]
+        percentages = np.round(counts / len(sentiments) * 100, 1)
         
         self.analysis_results['sentiment_analysis'] = {
-            'distribution': sentiment_dist.to_dict(),
-            'percentages': sentiment_percentages.to_dict(),
-            'average_sentiment': round(sum(sentiment_scores) / len(sentiment_scores), 3)
+            'distribution': dict(zip(labels.tolist(), counts.tolist())),
+            'percentages': dict(zip(labels.tolist(), percentages.tolist())),
+            'average_sentiment': round(float(sentiment_scores.mean()), 3) if len(sentiment_scores) else 0
         }
         
         print("✅ Sentiment analysis complete")
@@ -83,56 +252,24 @@ class FeedbackAnalyzer:
             print("❌ No feedback data loaded")
             return None
             
-        # Common UX/product keywords to look for
-        ux_keywords = [
-            'easy', 'difficult', 'confusing', 'intuitive', 'simple', 'complicated',
-            'fast', 'slow', 'quick', 'loading', 'responsive', 'laggy',
-            'design', 'interface', 'layout', 'navigation', 'menu', 'button',
-            'search', 'find', 'discover', 'browse', 'filter', 'sort',
-            'recommendation', 'suggest', 'personalize', 'relevant', 'accurate',
-            'bug', 'error', 'crash', 'broken', 'issue', 'problem',
-            'love', 'hate', 'like', 'dislike', 'amazing', 'terrible', 'great', 'awful'
-        ]
-        
-        # Extract keywords from all feedback
-        all_keywords = []
-        for feedback in self.feedback_data['feedback']:
-            if pd.isna(feedback):
-                continue
-                
-            # Clean and tokenize text
-            text = str(feedback).lower()
-            words = re.findall(r'\b\w+\b', text)
-            
-            # Find UX keywords
-            found_keywords = [word for word in words if word in ux_keywords]
-            all_keywords.extend(found_keywords)
-        
-        # Count keyword frequency
-        keyword_counts = Counter(all_keywords)
-        common_themes = {k: v for k, v in keyword_counts.items() if v >= min_frequency}
-        
-        # Categorize themes
-        theme_categories = {
-            'usability': ['easy', 'difficult', 'confusing', 'intuitive', 'simple', 'complicated'],
-            'performance': ['fast', 'slow', 'quick', 'loading', 'responsive', 'laggy'],
-            'design': ['design', 'interface', 'layout', 'navigation', 'menu', 'button'],
-            'functionality': ['search', 'find', 'discover', 'browse', 'filter', 'sort'],
-            'personalization': ['recommendation', 'suggest', 'personalize', 'relevant', 'accurate'],
-            'technical_issues': ['bug', 'error', 'crash', 'broken', 'issue', 'problem'],
-            'sentiment': ['love', 'hate', 'like', 'dislike', 'amazing', 'terrible', 'great', 'awful']
+        # Keep keywords mentioned often enough
+        keyword_counts = self._pipeline()['keyword_counts']
+        common = (keyword_counts >= min_frequency) & (keyword_counts > 0)
+        common_themes = {
+            self._ux_keywords[i]: int(keyword_counts[i]) for i in np.flatnonzero(common)
         }
         
-        categorized_themes = {}
-        for category, keywords in theme_categories.items():
-            category_count = sum(common_themes.get(keyword, 0) for keyword in keywords)
-            if category_count > 0:
-                categorized_themes[category] = category_count
+        # Categorize themes (keywords are stored contiguously per category)
+        category_counts = np.add.reduceat(np.where(common, keyword_counts, 0), self._category_starts)
+        categorized_themes = {
+            category: int(count)
+            for category, count in zip(self.THEME_CATEGORIES, category_counts) if count > 0
+        }
         
         self.analysis_results['theme_analysis'] = {
             'common_keywords': common_themes,
             'theme_categories': categorized_themes,
-            'total_keywords_found': len(all_keywords)
+            'total_keywords_found': int(keyword_counts.sum())
         }
         
         print("✅ Theme extraction complete")
@@ -144,32 +281,24 @@ class FeedbackAnalyzer:
             print("❌ Run sentiment analysis first")
             return None
             
-        # Find negative feedback
-        negative_feedback = self.feedback_data[self.feedback_data['sentiment'] == 'negative']
-        
-        if len(negative_feedback) == 0:
+        if not (self.feedback_data['sentiment'] == 'negative').any():
             return {'message': 'No negative feedback found'}
         
-        # Extract common issues from negative feedback
-        negative_keywords = []
-        for feedback in negative_feedback['feedback']:
-            if pd.isna(feedback):
-                continue
-            text = str(feedback).lower()
-            words = re.findall(r'\b\w+\b', text)
-            negative_keywords.extend(words)
-        
-        # Focus on problem-related keywords
-        problem_keywords = [
-            'slow', 'confusing', 'difficult', 'complicated', 'broken', 'error', 
-            'bug', 'crash', 'loading', 'laggy', 'terrible', 'awful', 'hate',
-            'problem', 'issue', 'frustrating', 'annoying'
-        ]
+        # Problem keywords were matched in negative feedback during the shared pass
+        negative_issues = self._pipeline()['problem_counts']
         
-        negative_issues = Counter([kw for kw in negative_keywords if kw in problem_keywords])
+        # Top five by frequency via O(n) partial selection; the position term breaks
+        # ties by first mention, matching Counter.most_common
+        issues = list(negative_issues)
+        counts = np.fromiter(negative_issues.values(), dtype=np.int64, count=len(issues))
+        rank_key = -counts * len(issues) + np.arange(len(issues))
+        top_n = min(5, len(issues))
+        top = np.argpartition(rank_key, top_n - 1)[:top_n] if top_n else np.empty(0, dtype=np.intp)
+        top = top[np.argsort(rank_key[top])]
         
         priority_issues = []
-        for issue, count in negative_issues.most_common(5):
+        for i in top.tolist():
+            issue, count = issues[i], int(counts[i])
             percentage = (count / len(self.feedback_data)) * 100
             priority_issues.append({
                 'issue': issue,
@@ -226,22 +355,29 @@ class FeedbackAnalyzer:
                 
                 # Generate recommendations
                 issue_type = top_issue['issue']
-                if issue_type in ['slow', 'loading', 'laggy']:
+                if issue_type in {'slow', 'loading', 'laggy'}:
                     report['recommendations'].append("Investigate performance optimization opportunities")
-                elif issue_type in ['confusing', 'difficult', 'complicated']:
+                elif issue_type in {'confusing', 'difficult', 'complicated'}:
                     report['recommendations'].append("Consider UX/UI simplification and user testing")
-                elif issue_type in ['broken', 'error', 'bug', 'crash']:
+                elif issue_type in {'broken', 'error', 'bug', 'crash'}:
                     report['recommendations'].append("Prioritize bug fixes and technical stability improvements")
         
         return report
     
-    def create_visualization(self, output_path='feedback_analysis.png'):
-        """Create visualizations of feedback analysis"""
+    def create_visualization(self, output_path='feedback_analysis.png', dpi=150):
+        """
+        Create visualizations of feedback analysis
+        
+        Args:
+            output_path: Where to save the dashboard image
+            dpi: Output resolution (raise to 300 for publication quality)
+        """
         if not self.analysis_results:
             print("❌ No analysis results to visualize")
             return False
             
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        plt = self._pyplot()
+        fig, axes = plt.subplots(2, 2, figsize=(15, 10), constrained_layout=True)
         fig.suptitle('Automated Feedback Analysis Dashboard', fontsize=16, fontweight='bold')
         
         # 1. Sentiment Distribution
@@ -285,8 +421,7 @@ class FeedbackAnalyzer:
             axes[1,1].set_xlabel('Sentiment Score (-1 to 1)')
             axes[1,1].axvline(x=0, color='red', linestyle='--', alpha=0.7)
         
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        plt.savefig(output_path, dpi=dpi)
         print(f"✅ Feedback analysis visualization saved to {output_path}")
         
         return True
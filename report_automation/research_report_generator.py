@@ -5,70 +5,15 @@ Saves hours of manual report formatting and chart creation
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
+import base64
+import io
 import json
 import os
+from string import Template
 
-class ResearchReportGenerator:
-    def __init__(self, data_source):
-        """
-        Initialize report generator with data source
-        
-        Args:
-            data_source: Path to data file or processed analysis results
-        """
-        self.data_source = data_source
-        self.report_data = {}
-        self.template_path = "report_automation/report_template.html"
-        
-    def load_analysis_results(self, analysis_results):
-        """Load processed analysis results"""
-        self.report_data = analysis_results
-        return True
-    
-    def generate_charts(self, output_dir="report_automation/charts/"):
-        """Generate charts for the research report"""
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
-        charts_created = []
-        
-        # Chart 1: Satisfaction Overview
-        if 'satisfaction_metrics' in self.report_data:
-            features = []
-            satisfaction_rates = []
-            
-            for feature, metrics in self.report_data['satisfaction_metrics'].items():
-                if 'satisfaction_rate' in metrics:
-                    features.append(feature.replace('_rating', '').title())
-                    satisfaction_rates.append(metrics['satisfaction_rate'])
-            
-            if features:
-                plt.figure(figsize=(10, 6))
-                bars = plt.bar(features, satisfaction_rates, color=['#2ecc71' if x >= 70 else '#e74c3c' for x in satisfaction_rates])
-                plt.title('User Satisfaction by Feature', fontsize=16, fontweight='bold')
-                plt.ylabel('Satisfaction Rate (%)')
-                plt.ylim(0, 100)
-                
-                # Add percentage labels on bars
-                for bar, rate in zip(bars, satisfaction_rates):
-                    plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
-                            f'{rate}%', ha='center', va='bottom', fontweight='bold')
-                
-                plt.tight_layout()
-                chart_path = os.path.join(output_dir, 'satisfaction_overview.png')
-                plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-                charts_created.append(chart_path)
-                plt.close()
-        
-        return charts_created
-    
-    def create_html_report(self, output_path="research_report.html"):
-        """Generate HTML research report"""
-        
-        # Basic HTML template
-        html_template = """
+# Report page template, parsed once at import ($-placeholders leave the CSS braces alone)
+REPORT_TEMPLATE = Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -88,13 +33,14 @@ class ResearchReportGenerator:
         .recommendation { background: #e8f5e8; padding: 15px; border-left: 4px solid #27ae60; margin: 10px 0; border-radius: 5px; }
         .warning { background: #fef9e7; padding: 15px; border-left: 4px solid #f39c12; margin: 10px 0; border-radius: 5px; }
         .critical { background: #fdeaea; padding: 15px; border-left: 4px solid #e74c3c; margin: 10px 0; border-radius: 5px; }
+        .chart { max-width: 100%; height: auto; margin: 10px 0; }
     </style>
 </head>
 <body>
     <div class="header">
         <h1>UX Research Report</h1>
-        <p>Automated Analysis Generated on {timestamp}</p>
-        <p>Total Survey Responses Analyzed: {total_responses}</p>
+        <p>Automated Analysis Generated on ${timestamp}</p>
+        <p>Total Survey Responses Analyzed: ${total_responses}</p>
     </div>
     
     <div class="section">
@@ -102,29 +48,31 @@ class ResearchReportGenerator:
         <p>This report presents automated analysis of user feedback data, highlighting key satisfaction metrics and actionable insights for product improvement.</p>
         
         <div class="metric-box">
-            <div class="metric-value">{avg_satisfaction}%</div>
+            <div class="metric-value">${avg_satisfaction}%</div>
             <div class="metric-label">Average User Satisfaction</div>
         </div>
         
         <div class="metric-box">
-            <div class="metric-value">{total_responses}</div>
+            <div class="metric-value">${total_responses}</div>
             <div class="metric-label">Survey Responses Analyzed</div>
         </div>
     </div>
     
     <div class="section">
         <h2>🎯 Key Findings</h2>
-        {findings_html}
+        ${findings_html}
     </div>
     
     <div class="section">
         <h2>💡 Recommendations</h2>
-        {recommendations_html}
+        ${recommendations_html}
     </div>
     
+    ${charts_html}
+    
     <div class="section">
         <h2>📈 Detailed Metrics</h2>
-        {detailed_metrics_html}
+        ${detailed_metrics_html}
     </div>
     
     <div class="section">
@@ -141,7 +89,146 @@ class ResearchReportGenerator:
     </div>
 </body>
 </html>
-"""
+""")
+
+# Satisfaction metric fields shown in the detailed metrics section
+METRIC_FIELDS = frozenset({'mean', 'satisfaction_rate', 'count'})
+
+def _render_metric_box(feature, metrics):
+    """Detailed-metric card for any metrics dict (missing fields shown as 0)"""
+    return _metric_box_html(
+        feature, metrics.get('satisfaction_rate', 0), metrics.get('mean', 0), metrics.get('count', 0)
+    )
+
+def _render_known_metric_box(feature, metrics):
+    """Detailed-metric card specialized for dicts known to carry every METRIC_FIELDS key"""
+    return _metric_box_html(feature, metrics['satisfaction_rate'], metrics['mean'], metrics['count'])
+
+def _metric_box_html(feature, satisfaction_rate, mean_score, response_count):
+    """Format one detailed-metric card"""
+    feature_name = feature.replace('_rating', '').title()
+    return f"""
+                <div class="metric-box">
+                    <h4>{feature_name}</h4>
+                    <p><strong>Satisfaction Rate:</strong> {satisfaction_rate}%</p>
+                    <p><strong>Average Score:</strong> {mean_score}/5</p>
+                    <p><strong>Responses:</strong> {response_count}</p>
+                </div>
+                """
+
+class ResearchReportGenerator:
+    # matplotlib.pyplot, imported on first chart
+    _plt = None
+    
+    def __init__(self, data_source):
+        """
+        Initialize report generator with data source
+        
+        Args:
+            data_source: Path to data file or processed analysis results
+        """
+        self.data_source = data_source
+        self.report_data = {}
+        # Base64 PNGs from generate_charts(), kept apart from the caller's results
+        self.charts = {}
+        self.template_path = "report_automation/report_template.html"
+        self._render_metric = _render_metric_box
+        
+    def load_analysis_results(self, analysis_results):
+        """Load processed analysis results"""
+        self.report_data = analysis_results
+        self.charts = {}
+        
+        # Pick the metric formatter once for this schema: skip per-field .get() defaults
+        # when every feature carries the full set of fields
+        metrics = analysis_results.get('satisfaction_metrics') or {}
+        if metrics and all(METRIC_FIELDS <= m.keys() for m in metrics.values()):
+            self._render_metric = _render_known_metric_box
+        else:
+            self._render_metric = _render_metric_box
+        return True
+    
+    @classmethod
+    def _pyplot(cls):
+        """Import pyplot (Agg backend) on first use so report-only runs never load matplotlib"""
+        if cls._plt is None:
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+            # Resolve the bundled font directly instead of walking the sans-serif fallback list
+            plt.rcParams['font.family'] = 'DejaVu Sans'
+            cls._plt = plt
+        return cls._plt
+    
+    def _store_chart(self, fig, name, output_dir, dpi):
+        """
+        Render a chart to PNG in memory, embed it in the report data and optionally save it
+        
+        Returns:
+            Path of the saved PNG file, or the chart name when output_dir is None
+        """
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi)
+        png_bytes = buffer.getvalue()
+        self.charts[name] = base64.b64encode(png_bytes).decode('ascii')
+        
+        if output_dir is None:
+            return name
+        chart_path = os.path.join(output_dir, f'{name}.png')
+        with open(chart_path, 'wb') as f:
+            f.write(png_bytes)
+        return chart_path
+    
+    def generate_charts(self, output_dir=None, dpi=150):
+        """
+        Generate charts for the research report
+        
+        Charts are rendered in memory and embedded in the HTML report as base64 images.
+        
+        Args:
+            output_dir: Optional directory to also save chart PNG files in
+            dpi: Output resolution (raise to 300 for publication quality)
+        Returns:
+            List of chart file paths generated (chart names when output_dir is None)
+        """
+        if output_dir is not None and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+            
+        charts_created = []
+        
+        # One figure is reused for every chart; each chart starts by clearing the axes
+        plt = self._pyplot()
+        fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+        
+        # Chart 1: Satisfaction Overview
+        if 'satisfaction_metrics' in self.report_data:
+            features = []
+            satisfaction_rates = []
+            
+            for feature, metrics in self.report_data['satisfaction_metrics'].items():
+                if 'satisfaction_rate' in metrics:
+                    features.append(feature.replace('_rating', '').title())
+                    satisfaction_rates.append(metrics['satisfaction_rate'])
+            
+            if features:
+                ax.clear()
+                bars = ax.bar(features, satisfaction_rates, color=['#2ecc71' if x >= 70 else '#e74c3c' for x in satisfaction_rates])
+                ax.set_title('User Satisfaction by Feature', fontsize=16, fontweight='bold')
+                ax.set_ylabel('Satisfaction Rate (%)')
+                ax.set_ylim(0, 100)
+                
+                # Add percentage labels on bars
+                for bar, rate in zip(bars, satisfaction_rates):
+                    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
+                            f'{rate}%', ha='center', va='bottom', fontweight='bold')
+                
+                charts_created.append(self._store_chart(fig, 'satisfaction_overview', output_dir, dpi))
+        
+        plt.close(fig)
+        return charts_created
+    
+    def create_html_report(self, output_path="research_report.html"):
+        """Generate HTML research report"""
         
         # Process data for template
         timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
@@ -159,55 +246,54 @@ class ResearchReportGenerator:
             avg_satisfaction = 0
         
         # Generate findings HTML
-        findings_html = ""
+        findings_parts = []
         if 'key_findings' in self.report_data:
             for finding in self.report_data['key_findings']:
                 if '✅' in finding:
-                    findings_html += f'<div class="recommendation">{finding}</div>'
+                    findings_parts.append(f'<div class="recommendation">{finding}</div>')
                 elif '⚠️' in finding:
-                    findings_html += f'<div class="warning">{finding}</div>'
+                    findings_parts.append(f'<div class="warning">{finding}</div>')
                 elif '❌' in finding:
-                    findings_html += f'<div class="critical">{finding}</div>'
+                    findings_parts.append(f'<div class="critical">{finding}</div>')
                 else:
-                    findings_html += f'<p>{finding}</p>'
+                    findings_parts.append(f'<p>{finding}</p>')
+        findings_html = ''.join(findings_parts)
         
         # Generate recommendations HTML
-        recommendations_html = ""
-        if 'recommendations' in self.report_data:
-            for rec in self.report_data['recommendations']:
-                recommendations_html += f'<div class="recommendation">💡 {rec}</div>'
+        recommendations_html = ''.join(
+            f'<div class="recommendation">💡 {rec}</div>'
+            for rec in self.report_data.get('recommendations', [])
+        )
         
         # Generate detailed metrics HTML
-        detailed_metrics_html = ""
-        if 'satisfaction_metrics' in self.report_data:
-            for feature, metrics in self.report_data['satisfaction_metrics'].items():
-                feature_name = feature.replace('_rating', '').title()
-                satisfaction_rate = metrics.get('satisfaction_rate', 0)
-                mean_score = metrics.get('mean', 0)
-                response_count = metrics.get('count', 0)
-                
-                detailed_metrics_html += f"""
-                <div class="metric-box">
-                    <h4>{feature_name}</h4>
-                    <p><strong>Satisfaction Rate:</strong> {satisfaction_rate}%</p>
-                    <p><strong>Average Score:</strong> {mean_score}/5</p>
-                    <p><strong>Responses:</strong> {response_count}</p>
-                </div>
-                """
+        detailed_metrics_html = ''.join(
+            self._render_metric(feature, metrics)
+            for feature, metrics in self.report_data.get('satisfaction_metrics', {}).items()
+        )
+        
+        # Generate embedded charts HTML
+        charts_html = ''
+        if self.charts:
+            images = ''.join(
+                f'<img class="chart" alt="{name}" src="data:image/png;base64,{png_b64}">'
+                for name, png_b64 in self.charts.items()
+            )
+            charts_html = f'<div class="section">\n        <h2>📉 Charts</h2>\n        {images}\n    </div>'
         
         # Fill template
-        html_content = html_template.format(
+        html_content = REPORT_TEMPLATE.substitute(
             timestamp=timestamp,
             total_responses=total_responses,
             avg_satisfaction=avg_satisfaction,
             findings_html=findings_html,
             recommendations_html=recommendations_html,
+            charts_html=charts_html,
             detailed_metrics_html=detailed_metrics_html
         )
         
-        # Save report
-        with open(output_path, 'w') as f:
-            f.write(html_content)
+        # Save report (encode once, write through a single large buffer)
+        with open(output_path, 'wb', buffering=1024 * 1024) as f:
+            f.write(html_content.encode('utf-8'))
         
         print(f"✅ Research report generated: {output_path}")
         return output_path
@@ -1,4 +1,3 @@
-```python
 """
 Survey Data Processor - UX Research Automation
 Automatically process survey exports from Qualtrics, SurveyMonkey, etc.
@@ -6,28 +5,240 @@ Converts raw survey data into clean analysis and visualizations.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
+import json
 import numpy as np
+import os
+import warnings
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Parquet schema metadata key recording which CSV a snapshot was built from
+SNAPSHOT_SOURCE_KEY = b'survey_source_csv'
+
+# Columns of the rating_stats result
+SUM, SUM_SQ, COUNT, MAX, GE4, GE9, LE6 = range(7)
+
+def _rating_stats_loop(ratings):
+    """
+    Fused per-column reductions over a (rows, columns) float rating matrix
+    
+    One sweep per column computes sum, sum of squares, non-missing count, max
+    (-inf if all missing) and the >=4 / >=9 / <=6 tallies. NaN marks a missing rating.
+    """
+    n_rows, n_cols = ratings.shape
+    stats = np.zeros((n_cols, 7))
+    for j in prange(n_cols):
+        total = 0.0
+        total_sq = 0.0
+        count = 0.0
+        peak = -np.inf
+        ge4 = 0.0
+        ge9 = 0.0
+        le6 = 0.0
+        for i in range(n_rows):
+            x = ratings[i, j]
+            if np.isnan(x):
+                continue
+            total += x
+            total_sq += x * x
+            count += 1
+            if x > peak:
+                peak = x
+            if x >= 4:
+                ge4 += 1
+            if x >= 9:
+                ge9 += 1
+            if x <= 6:
+                le6 += 1
+        stats[j, SUM] = total
+        stats[j, SUM_SQ] = total_sq
+        stats[j, COUNT] = count
+        stats[j, MAX] = peak
+        stats[j, GE4] = ge4
+        stats[j, GE9] = ge9
+        stats[j, LE6] = le6
+    return stats
+
+def _rating_stats_numpy(ratings):
+    """Same reductions as _rating_stats_loop, as vectorized NumPy (used without numba)"""
+    valid = ~np.isnan(ratings)
+    filled = np.where(valid, ratings, 0.0)
+    stats = np.empty((ratings.shape[1], 7))
+    stats[:, SUM] = filled.sum(axis=0)
+    stats[:, SUM_SQ] = (filled * filled).sum(axis=0)
+    stats[:, COUNT] = valid.sum(axis=0)
+    stats[:, MAX] = np.where(valid, ratings, -np.inf).max(axis=0, initial=-np.inf)
+    stats[:, GE4] = (ratings >= 4).sum(axis=0)
+    stats[:, GE9] = (ratings >= 9).sum(axis=0)
+    stats[:, LE6] = (ratings <= 6).sum(axis=0)
+    return stats
+
+# fastmath is left off: it lets LLVM assume no NaNs, which would break the missing-rating checks
+if njit is not None:
+    rating_stats = njit(parallel=True, cache=True)(_rating_stats_loop)
+else:
+    rating_stats = _rating_stats_numpy
+
+def _segment_stats_loop(ratings, codes, n_segments):
+    """
+    Per-segment reductions over a (rows, columns) float rating matrix
+    
+    codes holds each row's segment (-1 for rows without one). Returns
+    (segments, columns) arrays of answered count, sum, >=4 count and max (NaN if
+    the segment has no answers for that column).
+    """
+    n_rows, n_cols = ratings.shape
+    counts = np.zeros((n_segments, n_cols))
+    sums = np.zeros((n_segments, n_cols))
+    satisfied = np.zeros((n_segments, n_cols))
+    maxes = np.full((n_segments, n_cols), np.nan)
+    for j in prange(n_cols):
+        for i in range(n_rows):
+            g = codes[i]
+            x = ratings[i, j]
+            if g < 0 or np.isnan(x):
+                continue
+            counts[g, j] += 1
+            sums[g, j] += x
+            if x >= 4:
+                satisfied[g, j] += 1
+            if np.isnan(maxes[g, j]) or x > maxes[g, j]:
+                maxes[g, j] = x
+    return counts, sums, satisfied, maxes
+
+def _segment_stats_numpy(ratings, codes, n_segments):
+    """Same reductions as _segment_stats_loop: sort rows by segment once, then reduce each block"""
+    order = np.argsort(codes, kind='stable')
+    order = order[codes[order] >= 0]
+    n_cols = ratings.shape[1]
+    if order.size == 0:
+        empty = np.zeros((n_segments, n_cols))
+        return empty, empty.copy(), empty.copy(), np.full((n_segments, n_cols), np.nan)
+    starts = np.r_[0, np.flatnonzero(np.diff(codes[order])) + 1]
+    values = ratings[order]
+    answered = ~np.isnan(values)
+    counts = np.add.reduceat(answered, starts, axis=0)
+    sums = np.add.reduceat(np.where(answered, values, 0.0), starts, axis=0)
+    satisfied = np.add.reduceat(answered & (np.nan_to_num(values) >= 4), starts, axis=0)
+    maxes = np.fmax.reduceat(values, starts, axis=0)
+    return counts, sums, satisfied, maxes
+
+if njit is not None:
+    segment_stats = njit(parallel=True, cache=True)(_segment_stats_loop)
+else:
+    segment_stats = _segment_stats_numpy
 
 class SurveyDataProcessor:
-    def __init__(self, file_path):
+    def __init__(self, file_path, io_engine='auto', fast=True):
         """
         Initialize survey processor with data file
         
         Args:
             file_path (str): Path to survey data CSV file
+            io_engine (str): 'auto' reuses the cleaned Parquet snapshot next to the CSV
+                when it was built from the CSV as it is now (same size and
+                modification time), 'csv' always parses the CSV,
+                'parquet' always reads the snapshot
+            fast (bool): Use the Arrow CSV parser and Arrow-backed columns when pyarrow
+                is installed, and the numba rating/segment kernels when numba is; False
+                keeps the plain pandas defaults and NumPy aggregation
         """
         self.file_path = file_path
+        self.io_engine = io_engine
+        self.fast = fast
+        self.cache_path = file_path + '.parquet'
         self.data = None
         self.processed_data = None
         self.insights = {}
+        self._rating_columns = []
+        self._rating_max = {}
+        self._loaded_from_cache = False
+        self._source_signature = None
+        
+    def _csv_signature(self):
+        """Size and modification time of the CSV, recorded in the snapshot it produces"""
+        stat = os.stat(self.file_path)
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        
+    def _use_parquet_cache(self):
+        """Whether load_data should read the Parquet snapshot instead of the CSV"""
+        if self.io_engine == 'parquet':
+            return True
+        if self.io_engine == 'csv' or pa is None or not os.path.exists(self.cache_path):
+            return False
+        # Exact match rather than "snapshot is newer": a CSV replaced by a file with an
+        # older timestamp (unzip, cp -p) must not be served stale results
+        recorded = (pq.read_schema(self.cache_path).metadata or {}).get(SNAPSHOT_SOURCE_KEY)
+        return recorded is not None and json.loads(recorded) == self._csv_signature()
+        
+    @staticmethod
+    def _is_timestamp(column):
+        """Whether a column already holds timestamps (Arrow date32/date64 days do not count)"""
+        if isinstance(column.dtype, pd.ArrowDtype):
+            return pa.types.is_timestamp(column.dtype.pyarrow_dtype)
+        return pd.api.types.is_datetime64_any_dtype(column)
+        
+    def _read_csv_arrow(self):
+        """
+        Parse the CSV with Arrow's multi-threaded reader into Arrow-backed columns
+        
+        Types are inferred, so ISO timestamps arrive parsed and anything else is left
+        as text for clean_data(). Quoted values may span lines (multi-line open-ended
+        answers), which Arrow only handles across its parse blocks when told to.
+        """
+        parse_options = pacsv.ParseOptions(newlines_in_values=True)
+        convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+        table = pacsv.read_csv(self.file_path, parse_options=parse_options, convert_options=convert_options)
+        return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+        
+    def _read_parquet_snapshot(self):
+        """
+        Read the cleaned Parquet snapshot
+        
+        Categorical columns are stored as Arrow dictionaries; they come back as pandas
+        categoricals (not Arrow dictionary columns) so they behave exactly as after a
+        fresh clean_data(), e.g. segments keep their first-appearance order.
+        """
+        table = pq.read_table(self.cache_path)
+        if not self.fast:
+            return table.to_pandas()
+        return table.to_pandas(
+            types_mapper=lambda arrow_type: None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+        )
         
     def load_data(self):
-        """Load survey data from CSV file"""
+        """Load survey data from CSV file (or its cleaned Parquet snapshot)"""
         try:
-            self.data = pd.read_csv(self.file_path)
+            self._loaded_from_cache = self._use_parquet_cache()
+            if self._loaded_from_cache:
+                # Binary columnar snapshot written by a previous clean_data() run
+                self.data = self._read_parquet_snapshot()
+            else:
+                # Taken before parsing, so the snapshot describes the file actually read
+                self._source_signature = self._csv_signature()
+                if self.fast and pa is not None:
+                    try:
+                        self.data = self._read_csv_arrow()
+                    except pa.ArrowInvalid as e:
+                        # Files Arrow's parser rejects (e.g. rows missing trailing fields)
+                        # still load through pandas
+                        print(f"⚠️ Arrow CSV parser failed ({e}), falling back to pandas")
+                        self.data = pd.read_csv(self.file_path)
+                else:
+                    self.data = pd.read_csv(self.file_path)
+            # Rating columns are identified once per load and reused by every analysis step
+            self._rating_columns = [col for col in self.data.columns if 'rating' in col.lower()]
             print(f"✅ Successfully loaded {len(self.data)} survey responses")
             return True
         except Exception as e:
@@ -42,21 +253,69 @@ class SurveyDataProcessor:
             
         # Remove empty responses
         initial_count = len(self.data)
-        self.data = self.data.dropna(how='all')
+        empty_rows = self.data.isna().to_numpy().all(axis=1)
+        if empty_rows.any():
+            self.data = self.data.loc[~empty_rows]
         
-        # Convert date columns
+        # Convert date columns (Arrow/Parquet loads of ISO timestamps arrive parsed)
         if 'survey_date' in self.data.columns:
-            self.data['survey_date'] = pd.to_datetime(self.data['survey_date'])
+            raw_dates = self.data['survey_date']
+            if isinstance(raw_dates.dtype, pd.ArrowDtype) and pa.types.is_date(raw_dates.dtype.pyarrow_dtype):
+                # Arrow reads plain ISO dates as date32: a cast, no parsing needed
+                self.data['survey_date'] = raw_dates.astype(pd.ArrowDtype(pa.timestamp('ns')))
+            elif not self._is_timestamp(raw_dates):
+                dates = pd.to_datetime(raw_dates, format='ISO8601', cache=True, errors='coerce')
+                if (dates.isna() & raw_dates.notna()).any():
+                    # Not ISO 8601 (e.g. MM/DD/YYYY exports): infer the format instead
+                    dates = pd.to_datetime(raw_dates, cache=True, errors='coerce')
+                self.data['survey_date'] = dates
             
-        # Standardize rating columns (handle different scales)
-        rating_columns = [col for col in self.data.columns if 'rating' in col.lower()]
-        for col in rating_columns:
-            self.data[col] = pd.to_numeric(self.data[col], errors='coerce')
+        # Standardize rating columns (handle different scales): parse only columns
+        # that did not already load as numbers, in one call
+        numeric_columns = set(self.data[self._rating_columns].select_dtypes(include='number').columns)
+        to_convert = [col for col in self._rating_columns if col not in numeric_columns]
+        if to_convert:
+            self.data[to_convert] = self.data[to_convert].apply(
+                pd.to_numeric, errors='coerce', downcast='integer'
+            )
+        
+        # Whole-number ratings within the int8 range fit in a nullable 1-byte integer;
+        # the scale maximum is cached for the metrics and charts that branch on it
+        int8 = np.iinfo(np.int8)
+        self._rating_max = {}
+        for col in self._rating_columns:
+            values = self.data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            self._rating_max[col] = float(values.max()) if values.size else np.nan
+            if (values.size and int8.min <= values.min() and self._rating_max[col] <= int8.max
+                    and np.array_equal(values, np.round(values))):
+                self.data[col] = self.data[col].astype('Int8')
+            
+        # Low-cardinality text columns (user segments) become categoricals so grouping
+        # and filtering run on small integer codes instead of hashed strings
+        for col in self.data.columns:
+            if col in self._rating_columns or not pd.api.types.is_string_dtype(self.data[col].dtype):
+                continue
+            if self.data[col].nunique() < 0.05 * len(self.data):
+                self.data[col] = self.data[col].astype('category')
             
         final_count = len(self.data)
         print(f"✅ Data cleaned: {initial_count} → {final_count} responses")
         
         self.processed_data = self.data
+        
+        # Snapshot the cleaned data so later runs can skip CSV parsing
+        if not self._loaded_from_cache and self.io_engine != 'csv' and pa is not None:
+            try:
+                table = pa.Table.from_pandas(self.processed_data)
+                metadata = dict(table.schema.metadata or {})
+                metadata[SNAPSHOT_SOURCE_KEY] = json.dumps(self._source_signature).encode()
+                pq.write_table(
+                    table.replace_schema_metadata(metadata), self.cache_path,
+                    compression='zstd', use_dictionary=True
+                )
+            except Exception as e:
+                print(f"⚠️ Could not write Parquet cache: {e}")
         return True
     
     def calculate_satisfaction_metrics(self):
@@ -66,37 +325,124 @@ class SurveyDataProcessor:
             return None
             
         metrics = {}
+        rating_columns = self._rating_columns
         
-        # Find rating columns
-        rating_columns = [col for col in self.processed_data.columns if 'rating' in col.lower()]
-        
-        for col in rating_columns:
-            if col in self.processed_data.columns:
-                # Basic statistics
-                metrics[col] = {
-                    'mean': round(self.processed_data[col].mean(), 2),
-                    'median': self.processed_data[col].median(),
-                    'count': self.processed_data[col].count(),
-                    'std': round(self.processed_data[col].std(), 2)
-                }
-                
-                # Satisfaction rate (4-5 on 5-point scale)
-                if self.processed_data[col].max() <= 5:
-                    satisfied = self.processed_data[col] >= 4
-                    metrics[col]['satisfaction_rate'] = round(
-                        (satisfied.sum() / len(satisfied)) * 100, 1
-                    )
-                
-                # Net Promoter Score style (9-10 promoters, 0-6 detractors on 10-point scale)
-                if self.processed_data[col].max() <= 10:
-                    promoters = self.processed_data[col] >= 9
-                    detractors = self.processed_data[col] <= 6
-                    nps = ((promoters.sum() - detractors.sum()) / len(self.processed_data[col])) * 100
-                    metrics[col]['nps_score'] = round(nps, 1)
+        # One float matrix for all rating columns, reduced in a single fused pass
+        ratings = self.processed_data[rating_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        n_rows = ratings.shape[0]
+        stats_by_column = rating_stats if self.fast else _rating_stats_numpy
+        stats = stats_by_column(ratings)
+        counts = stats[:, COUNT]
+        maxes = np.array([self._rating_max[col] for col in rating_columns])
+        promoters = stats[:, GE9]
+        detractors = stats[:, LE6]
+        with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+            # All-missing columns reduce to NaN, as the pandas reductions do
+            warnings.simplefilter('ignore', RuntimeWarning)
+            means = stats[:, SUM] / counts
+            variances = (stats[:, SUM_SQ] - stats[:, SUM] * means) / (counts - 1)
+            stds = np.sqrt(np.maximum(variances, 0.0))
+            stds[counts < 2] = np.nan
+            # Share of answered ratings that are 4 or higher; missing ratings are not counted
+            satisfaction_rates = np.round(stats[:, GE4] / counts * 100, 1)
+            # Median needs a partition, which the streaming kernel cannot provide
+            medians = np.nanmedian(ratings, axis=0)
+        
+        for i, col in enumerate(rating_columns):
+            # Basic statistics
+            metrics[col] = {
+                'mean': round(float(means[i]), 2),
+                'median': float(medians[i]),
+                'count': int(counts[i]),
+                'std': round(float(stds[i]), 2)
+            }
+            
+            # Satisfaction rate (4-5 on 5-point scale)
+            if maxes[i] <= 5:
+                metrics[col]['satisfaction_rate'] = satisfaction_rates[i]
+            
+            # Net Promoter Score style (9-10 promoters, 0-6 detractors on 10-point scale)
+            if maxes[i] <= 10:
+                nps = (promoters[i] - detractors[i]) / n_rows * 100
+                metrics[col]['nps_score'] = round(nps, 1)
         
         self.insights['satisfaction_metrics'] = metrics
         return metrics
     
+    def stream_metrics(self, chunk_size=200_000):
+        """
+        Calculate satisfaction metrics by streaming the CSV in chunks
+        
+        Memory use is bounded by chunk_size however large the file is, so this works
+        on exports that do not fit in RAM. Medians need the whole column and are not
+        reported; everything else matches calculate_satisfaction_metrics().
+        
+        Args:
+            chunk_size (int): Number of rows to read per chunk
+        Returns:
+            Dictionary of satisfaction metrics per rating column
+        """
+        rating_columns = None
+        n_rows = 0
+        stats_by_column = rating_stats if self.fast else _rating_stats_numpy
+        
+        for chunk in pd.read_csv(self.file_path, chunksize=chunk_size):
+            chunk = chunk.dropna(how='all')
+            if rating_columns is None:
+                rating_columns = [col for col in chunk.columns if 'rating' in col.lower()]
+                n_cols = len(rating_columns)
+                count = np.zeros(n_cols)
+                mean = np.zeros(n_cols)
+                m2 = np.zeros(n_cols)
+                peak = np.full(n_cols, -np.inf)
+                satisfied = np.zeros(n_cols)
+                promoters = np.zeros(n_cols)
+                detractors = np.zeros(n_cols)
+            
+            ratings = chunk[rating_columns].apply(pd.to_numeric, errors='coerce')
+            stats = stats_by_column(ratings.to_numpy(dtype=np.float64, na_value=np.nan))
+            n_rows += len(chunk)
+            
+            # Merge this chunk's count/mean/M2 into the running totals (Chan et al.)
+            chunk_count = stats[:, COUNT]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                chunk_mean = np.where(chunk_count > 0, stats[:, SUM] / chunk_count, 0.0)
+                total = count + chunk_count
+                delta = chunk_mean - mean
+                weight = np.where(total > 0, chunk_count / total, 0.0)
+            mean += delta * weight
+            m2 += (stats[:, SUM_SQ] - stats[:, SUM] * chunk_mean) + delta * delta * count * weight
+            count = total
+            peak = np.maximum(peak, stats[:, MAX])
+            satisfied += stats[:, GE4]
+            promoters += stats[:, GE9]
+            detractors += stats[:, LE6]
+        
+        metrics = {}
+        for i, col in enumerate(rating_columns or []):
+            has_data = count[i] > 0
+            metrics[col] = {
+                'mean': round(float(mean[i]), 2) if has_data else np.nan,
+                'count': int(count[i]),
+                'std': round(float(np.sqrt(max(m2[i], 0.0) / (count[i] - 1))), 2) if count[i] > 1 else np.nan
+            }
+            if not has_data:
+                # No scale to judge, as with the NaN maximum in calculate_satisfaction_metrics
+                continue
+            
+            # Satisfaction rate (4-5 on 5-point scale)
+            if peak[i] <= 5:
+                metrics[col]['satisfaction_rate'] = round(satisfied[i] / count[i] * 100, 1)
+            
+            # Net Promoter Score style (9-10 promoters, 0-6 detractors on 10-point scale)
+            if peak[i] <= 10:
+                nps = (promoters[i] - detractors[i]) / n_rows * 100
+                metrics[col]['nps_score'] = round(nps, 1)
+        
+        print(f"✅ Streamed {n_rows} survey responses")
+        self.insights['satisfaction_metrics'] = metrics
+        return metrics
+    
     def analyze_by_segments(self, segment_column):
         """Analyze satisfaction by user segments"""
         if segment_column not in self.processed_data.columns:
@@ -104,23 +450,29 @@ class SurveyDataProcessor:
             return None
             
         segment_analysis = {}
-        rating_columns = [col for col in self.processed_data.columns if 'rating' in col.lower()]
+        rating_columns = self._rating_columns
         
-        for segment in self.processed_data[segment_column].unique():
-            segment_data = self.processed_data[self.processed_data[segment_column] == segment]
-            segment_metrics = {}
-            
-            for rating_col in rating_columns:
-                if rating_col in segment_data.columns:
-                    segment_metrics[rating_col] = {
-                        'mean': round(segment_data[rating_col].mean(), 2),
-                        'count': segment_data[rating_col].count(),
-                        'satisfaction_rate': round(
-                            ((segment_data[rating_col] >= 4).sum() / len(segment_data)) * 100, 1
-                        ) if segment_data[rating_col].max() <= 5 else None
-                    }
-            
-            segment_analysis[segment] = segment_metrics
+        # Per-segment reductions for every rating column at once (rows with no segment
+        # are skipped); segments come out in first-appearance order
+        codes, uniques = pd.factorize(self.processed_data[segment_column], sort=False)
+        values = self.processed_data[rating_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        stats_by_segment = segment_stats if self.fast else _segment_stats_numpy
+        counts, sums, satisfied, maxes = stats_by_segment(values, codes, len(uniques))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.round(sums / counts, 2)
+            # Satisfied share of answered ratings
+            satisfaction_rates = satisfied / counts * 100
+        
+        for i, segment in enumerate(uniques.tolist()):
+            segment_analysis[segment] = {
+                rating_col: {
+                    'mean': float(means[i, j]),
+                    'count': int(counts[i, j]),
+                    'satisfaction_rate': round(float(satisfaction_rates[i, j]), 1)
+                    if maxes[i, j] <= 5 else None
+                }
+                for j, rating_col in enumerate(rating_columns)
+            }
         
         self.insights['segment_analysis'] = segment_analysis
         return segment_analysis
@@ -131,12 +483,16 @@ class SurveyDataProcessor:
             print("❌ No processed data available for visualization")
             return False
             
+        # Plotting libraries are only imported when charts are requested
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         # Set up the plotting style
         plt.style.use('seaborn-v0_8')
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         fig.suptitle('Survey Analysis Dashboard', fontsize=16, fontweight='bold')
         
-        rating_columns = [col for col in self.processed_data.columns if 'rating' in col.lower()]
+        rating_columns = self._rating_columns
         
         if len(rating_columns) > 0:
             # 1. Rating Distribution
@@ -148,16 +504,27 @@ class SurveyDataProcessor:
             
             # 2. Satisfaction Rates by Feature (if multiple rating columns)
             if len(rating_columns) > 1:
-                satisfaction_rates = []
-                feature_names = []
+                shown_columns = rating_columns[:4]  # Limit to 4 features for readability
+                metrics = self.insights.get('satisfaction_metrics', {})
+                if all(col in metrics for col in shown_columns):
+                    # Reuse the rates from calculate_satisfaction_metrics
+                    rates = np.array([metrics[col].get('satisfaction_rate', np.nan) for col in shown_columns])
+                else:
+                    shown = self.processed_data[shown_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+                    stats_by_column = rating_stats if self.fast else _rating_stats_numpy
+                    stats = stats_by_column(shown)
+                    maxes = np.array([self._rating_max[col] for col in shown_columns])
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        rates = np.where(maxes <= 5, stats[:, GE4] / stats[:, COUNT] * 100, np.nan)
                 
-                for col in rating_columns[:4]:  # Limit to 4 features for readability
-                    if self.processed_data[col].max() <= 5:
-                        rate = ((self.processed_data[col] >= 4).sum() / len(self.processed_data)) * 100
-                        satisfaction_rates.append(rate)
-                        feature_names.append(col.replace('_rating', '').title())
+                # Only 5-point scales have a satisfaction rate
+                has_rate = ~np.isnan(rates)
+                satisfaction_rates = rates[has_rate]
+                feature_names = [
+                    col.replace('_rating', '').title() for col in np.array(shown_columns)[has_rate]
+                ]
                 
-                if satisfaction_rates:
+                if len(satisfaction_rates):
                     axes[0,1].bar(feature_names, satisfaction_rates)
                     axes[0,1].set_title('Satisfaction Rates by Feature')
                     axes[0,1].set_ylabel('Satisfaction %')
@@ -166,7 +533,7 @@ class SurveyDataProcessor:
             # 3. Response Timeline (if date column exists)
             if 'survey_date' in self.processed_data.columns:
                 daily_responses = self.processed_data.groupby(
-                    self.processed_data['survey_date'].dt.date
+                    self.processed_data['survey_date'].dt.floor('D')
                 ).size()
                 daily_responses.plot(ax=axes[1,0])
                 axes[1,0].set_title('Survey Responses Over Time')
@@ -230,14 +597,27 @@ def main():
     print("🚀 Starting Survey Data Processing Automation")
     print("=" * 50)
     
-    # Create sample data if it doesn't exist
+    # Create sample data if it doesn't exist (seeded, so reruns are reproducible)
+    n_responses = 50
+    rng = np.random.default_rng(0)
+    
+    # All three rating columns drawn at once: one uniform per cell, mapped through
+    # each column's cumulative 1-5 probabilities
+    rating_probs = np.array([
+        [0.1, 0.1, 0.2, 0.3, 0.3],       # voice_search_rating
+        [0.05, 0.1, 0.15, 0.35, 0.35],   # interface_rating
+        [0.08, 0.12, 0.25, 0.3, 0.25],   # recommendations_rating
+    ])
+    thresholds = rating_probs.cumsum(axis=1)[:, :-1]
+    ratings = (rng.random((n_responses, 3))[:, :, None] >= thresholds).sum(axis=2) + 1
+    
     sample_data = {
-        'user_id': [f'user_{i:03d}' for i in range(1, 51)],
-        'voice_search_rating': np.random.choice([1,2,3,4,5], 50, p=[0.1,0.1,0.2,0.3,0.3]),
-        'interface_rating': np.random.choice([1,2,3,4,5], 50, p=[0.05,0.1,0.15,0.35,0.35]),
-        'recommendations_rating': np.random.choice([1,2,3,4,5], 50, p=[0.08,0.12,0.25,0.3,0.25]),
-        'survey_date': pd.date_range('2024-07-01', periods=50, freq='D')[:50],
-        'user_type': np.random.choice(['new', 'returning', 'power_user'], 50, p=[0.3,0.5,0.2])
+        'user_id': np.char.add('user_', np.char.zfill(np.arange(1, n_responses + 1).astype(str), 3)),
+        'voice_search_rating': ratings[:, 0],
+        'interface_rating': ratings[:, 1],
+        'recommendations_rating': ratings[:, 2],
+        'survey_date': pd.date_range('2024-07-01', periods=n_responses, freq='D'),
+        'user_type': rng.choice(['new', 'returning', 'power_user'], n_responses, p=[0.3,0.5,0.2])
     }
     
     df = pd.DataFrame(sample_data)
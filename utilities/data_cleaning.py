@@ -6,13 +6,25 @@ Reusable functions for common data processing tasks
 import pandas as pd
 import numpy as np
 import re
+import warnings
 
-def clean_survey_data(df):
+try:
+    import pyarrow  # noqa: F401 - enables the Arrow-backed string dtype
+    _TEXT_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _TEXT_DTYPE = 'string'
+
+# Column names that hold ratings/scores
+_RATING_RE = re.compile(r'rating|score', re.I)
+
+def clean_survey_data(df, rating_cols=None):
     """
     Clean common issues in survey data exports
     
     Args:
         df: Raw survey DataFrame
+        rating_cols: Rating column names (after name cleaning); detected from
+            the column names when not given
     Returns:
         Cleaned DataFrame
     """
@@ -20,18 +32,33 @@ def clean_survey_data(df):
     df = df.dropna(how='all')
     
     # Clean column names (remove spaces, special characters)
-    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+    df.columns = [str(col).strip().lower().replace(' ', '_') for col in df.columns]
     
     # Convert rating columns to numeric
-    rating_cols = [col for col in df.columns if 'rating' in col or 'score' in col]
+    if rating_cols is None:
+        rating_cols = [col for col in df.columns if _RATING_RE.search(col)]
+    numeric_cols = set(df[rating_cols].select_dtypes(include='number').columns)
+    to_convert = [col for col in rating_cols if col not in numeric_cols]
+    if to_convert:
+        df[to_convert] = df[to_convert].apply(pd.to_numeric, errors='coerce', downcast='integer')
+    
+    # Whole-number ratings within the int8 range fit in a nullable 1-byte integer
+    int8 = np.iinfo(np.int8)
     for col in rating_cols:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if (values.size and int8.min <= values.min() and values.max() <= int8.max
+                and np.array_equal(values, np.round(values))):
+            df[col] = df[col].astype('Int8')
     
-    # Clean text columns
-    text_cols = df.select_dtypes(include=['object']).columns
+    # Clean text columns: object columns move to a string dtype once (Arrow-backed
+    # when available, so .str.strip runs as a vectorized kernel); missing values stay missing
+    text_cols = df.select_dtypes(include=['object', 'string']).columns
     for col in text_cols:
         if col not in rating_cols:
-            df[col] = df[col].astype(str).str.strip()
+            if not isinstance(df[col].dtype, pd.StringDtype):
+                df[col] = df[col].astype(_TEXT_DTYPE)
+            df[col] = df[col].str.strip()
     
     return df
 
@@ -79,15 +106,18 @@ def detect_data_quality_issues(df):
     if duplicates > 0:
         issues['duplicate_responses'] = duplicates
     
-    # Check for outliers in rating columns
+    # Check for outliers in rating columns (IQR rule, all columns at once)
     rating_cols = [col for col in df.columns if 'rating' in col]
-    for col in rating_cols:
-        if col in df.columns:
-            q1 = df[col].quantile(0.25)
-            q3 = df[col].quantile(0.75)
+    if rating_cols:
+        ratings = df[rating_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        with warnings.catch_warnings(), np.errstate(invalid='ignore'):
+            # All-missing columns give NaN quartiles (no outliers), as Series.quantile does
+            warnings.simplefilter('ignore', RuntimeWarning)
+            q1, q3 = np.nanquantile(ratings, [0.25, 0.75], axis=0)
             iqr = q3 - q1
-            outliers = df[(df[col] < (q1 - 1.5 * iqr)) | (df[col] > (q3 + 1.5 * iqr))]
-            if len(outliers) > len(df) * 0.05:  # More than 5% outliers
-                issues[f'{col}_outliers'] = len(outliers)
+            outlier_counts = ((ratings < q1 - 1.5 * iqr) | (ratings > q3 + 1.5 * iqr)).sum(axis=0)
+        # More than 5% outliers
+        for i in np.flatnonzero(outlier_counts > len(df) * 0.05):
+            issues[f'{rating_cols[i]}_outliers'] = int(outlier_counts[i])
     
     return issues